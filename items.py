@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class PageItem:
+    """
+    A scraped page as yielded by SiteSpider; list fields are '; '-joined strings.
+
+    The raw HTML is not carried on the item; it is written to saved_path.
+    """
+    url: str
+    title: str
+    meta_description: str
+    text: str
+    internal_links: str
+    external_links: str
+    emails: str
+    phones: str
+    saved_path: str
@@ -1,71 +1,158 @@
-import json
-import pandas as pd
+import logging
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import orjson
+
+
+# Static parts of a minimal single-sheet XLSX package
+XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+XLSX_SHEET_START = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+XLSX_SHEET_END = b'</sheetData></worksheet>'
+
+# Characters XML 1.0 cannot represent, even escaped
+ILLEGAL_XML_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+# Longest string Excel accepts in a single cell
+EXCEL_MAX_CELL_CHARS = 32767
+
+
+def xlsx_string_cell(ref, value):
+    value = ILLEGAL_XML_CHARS_RE.sub('', value[:EXCEL_MAX_CELL_CHARS])
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(value)}</t></is></c>'
 
 
 class ExcelPipeline:
     """Export items to XLSX with URL and text content."""
     
     def open_spider(self, spider):
-        self.items = []
+        self.zf = None
+        self.sheet = None
+        self.rows = 0
 
     def process_item(self, item, spider):
-        self.items.append(item)
+        try:
+            # Every cell is a string, so rows are emitted as inline-string sheet
+            # XML and streamed straight into the zip; the file is opened on the
+            # first item so an empty crawl leaves no file behind
+            if self.sheet is None:
+                self._open_workbook(spider)
+            self._write_row(item.url, item.text)
+        except Exception as e:
+            spider.log(f'Failed to write Excel row for {item.url}: {e}', level=logging.ERROR)
         return item
 
+    def _open_workbook(self, spider):
+        excel_path = spider.crawler.settings.get('EXCEL_PATH', 'output.xlsx')
+        self.zf = zipfile.ZipFile(excel_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1)
+        for name, xml in XLSX_STATIC_PARTS.items():
+            self.zf.writestr(name, xml)
+        self.sheet = self.zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True)
+        self.sheet.write(XLSX_SHEET_START)
+        self._write_row('URL', 'Content')
+
+    def _write_row(self, url, content):
+        self.rows += 1
+        self.sheet.write(
+            f'<row r="{self.rows}">{xlsx_string_cell(f"A{self.rows}", url)}'
+            f'{xlsx_string_cell(f"B{self.rows}", content)}</row>'.encode('utf-8')
+        )
+
     def close_spider(self, spider):
-        if not self.items:
+        if self.sheet is None:
             return
         
-        # Create DataFrame with URL and text content
-        xlsx_data = [
-            {'URL': item['url'], 'Content': item.get('text', '')}
-            for item in self.items
-        ]
-        df = pd.DataFrame(xlsx_data)
-        excel_path = spider.crawler.settings.get('EXCEL_PATH', 'output.xlsx')
-        
         try:
-            df.to_excel(excel_path, index=False)
-            spider.log(f'Wrote {len(self.items)} rows to {excel_path}')
+            self.sheet.write(XLSX_SHEET_END)
+            self.sheet.close()
+            self.zf.close()
+            spider.log(f'Wrote {self.rows - 1} rows to {self.zf.filename}')
         except Exception as e:
-            spider.log(f'Failed to write Excel file: {e}', level='ERROR')
+            spider.log(f'Failed to write Excel file: {e}', level=logging.ERROR)
 
 
 class JSONPipeline:
     """Export items to JSON with structured data (URL, title, links, DOM properties)."""
     
     def open_spider(self, spider):
-        self.items = []
+        self.file = None
+        self.count = 0
 
     def process_item(self, item, spider):
-        self.items.append(item)
+        # Parse internal links from semicolon-separated string
+        internal_links = [
+            link.strip()
+            for link in item.internal_links.split(';')
+            if link.strip()
+        ]
+        
+        record = {
+            'url': item.url,
+            'title': item.title,
+            'internal_links': internal_links,
+            'dom_properties': []  # Will be added separately if needed
+        }
+        
+        try:
+            # Open lazily so an empty crawl leaves no file behind, then stream
+            # one record per line inside a JSON array
+            if self.file is None:
+                json_path = spider.crawler.settings.get('JSON_PATH', 'output.json')
+                self.file = open(json_path, 'wb')
+                self.file.write(b'[\n')
+            if self.count:
+                self.file.write(b',\n')
+            self.file.write(orjson.dumps(record))
+            self.count += 1
+        except Exception as e:
+            spider.log(f'Failed to write JSON record for {item.url}: {e}', level=logging.ERROR)
         return item
 
     def close_spider(self, spider):
-        if not self.items:
+        if self.file is None:
             return
         
-        # Create JSON with structured data
-        json_data = []
-        for item in self.items:
-            # Parse internal links from semicolon-separated string
-            internal_links = [
-                link.strip()
-                for link in item.get('internal_links', '').split(';')
-                if link.strip()
-            ]
-            
-            json_data.append({
-                'url': item['url'],
-                'title': item.get('title', ''),
-                'internal_links': internal_links,
-                'dom_properties': []  # Will be added separately if needed
-            })
-        
-        json_path = spider.crawler.settings.get('JSON_PATH', 'output.json')
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-            spider.log(f'Wrote {len(self.items)} items to {json_path}')
+            self.file.write(b'\n]\n')
+            self.file.close()
+            spider.log(f'Wrote {self.count} items to {self.file.name}')
         except Exception as e:
-            spider.log(f'Failed to write JSON file: {e}', level='ERROR')
+            spider.log(f'Failed to write JSON file: {e}', level=logging.ERROR)
@@ -0,0 +1,7 @@
+# Subresources neither crawler reads; only the rendered HTML is used
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+def should_abort_request(request):
+    """Check whether a Playwright request is for a resource type the crawlers never read."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES
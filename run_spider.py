@@ -5,11 +5,14 @@ import argparse
 import sys
 
 
-def run_standalone(start_url, xlsx, json_file, max_pages, delay, timeout):
+def run_standalone(start_url, xlsx, json_file, dom_file, max_pages, delay, timeout, concurrency, state_db):
     """Run the standalone BeautifulSoup-based scraper."""
     from scraper import WebScraper
     
-    scraper = WebScraper(start_url, delay=delay, timeout=timeout)
+    scraper = WebScraper(
+        start_url, delay=delay, timeout=timeout, concurrency=concurrency, state_db=state_db,
+        dom_file=dom_file
+    )
     scraper.crawl(max_pages=max_pages)
     scraper.save_to_xlsx(xlsx)
     scraper.save_to_json(json_file)
@@ -61,16 +64,27 @@ def main():
     parser.add_argument('--output', '-o', default='output', help='Output directory (Scrapy mode)')
     parser.add_argument('--xlsx', '-x', default='scraped_content.xlsx', help='XLSX output file')
     parser.add_argument('--json', '-j', default='scraped_data.json', help='JSON output file')
+    parser.add_argument(
+        '--dom', default='scraped_dom.ndjson', help='NDJSON output file for full DOM properties (standalone mode)'
+    )
     parser.add_argument('--max-pages', type=int, help='Max pages to scrape')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests (seconds)')
     parser.add_argument('--timeout', type=int, default=10, help='Request timeout (seconds)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Pages fetched in parallel (standalone mode)')
+    parser.add_argument(
+        '--state-db',
+        help='SQLite file for crawl state; reuse it to resume a crawl (standalone mode, default: temporary file)'
+    )
     parser.add_argument('--log', default='INFO', help='Log level (Scrapy mode)')
     
     args = parser.parse_args()
     
     try:
         if args.mode == 'standalone':
-            run_standalone(args.url, args.xlsx, args.json, args.max_pages, args.delay, args.timeout)
+            run_standalone(
+                args.url, args.xlsx, args.json, args.dom, args.max_pages, args.delay, args.timeout,
+                args.concurrency, args.state_db
+            )
         else:
             run_scrapy(args.url, args.output, args.xlsx, args.json, args.log)
     except Exception as e:
@@ -1,13 +1,18 @@
-import json
+import asyncio
 import logging
+import os
 import re
-import time
-from collections import defaultdict
-from typing import Dict, List, Set, Optional
-from urllib.parse import urljoin, urlparse
+import sqlite3
+import tempfile
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
 
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import orjson
+from bs4 import BeautifulSoup, Tag
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+from resource_filter import should_abort_request
 
 # Configure logging
 logging.basicConfig(
@@ -20,68 +25,221 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Link schemes that never point at crawlable pages
+SKIPPED_SCHEMES = frozenset({'mailto', 'tel', 'javascript', 'data', 'blob'})
+# Only a colon this close to the start can end one of the schemes above
+_SCHEME_SCAN_END = max(len(scheme) for scheme in SKIPPED_SCHEMES) + 1
+
+# Truthy once the document has loaded and the body's text length is unchanged
+# since the previous poll
+DOM_STABLE_JS = """() => {
+    if (document.readyState !== 'complete' || !document.body) return false;
+    const length = document.body.innerText.length;
+    const stable = window.__scraperLastTextLength === length;
+    window.__scraperLastTextLength = length;
+    return stable;
+}"""
+
+
+def has_skipped_scheme(href: str) -> bool:
+    """Check whether a link uses a non-crawlable scheme, looking only at its first few characters."""
+    colon = href.find(':', 0, _SCHEME_SCAN_END)
+    return colon > 0 and href[:colon].lower() in SKIPPED_SCHEMES
+
+
+class CrawlState:
+    """
+    Visited set and FIFO crawl frontier kept in SQLite, so crawls can be resumed.
+
+    A URL stays in the frontier, marked claimed, while it is being scraped and only
+    moves to the visited set once its outlinks are queued. Claims left behind by an
+    interrupted crawl are released when the state is reopened. Scraped pages are
+    stored alongside, so a resumed crawl can export every page, not just its own.
+
+    A small LRU of recently seen URLs answers repeated links (e.g. navigation)
+    without a query; every other enqueue is deduplicated exactly by SQLite.
+    """
+
+    # Writes are batched into one transaction per this many statements
+    COMMIT_EVERY = 100
+    # Number of recently seen URLs remembered exactly; enough to cover the
+    # links repeated across neighbouring pages (navigation, footers)
+    RECENT_CAPACITY = 1_000
+
+    def __init__(self, path: str):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(
+            'CREATE TABLE IF NOT EXISTS visited(url TEXT PRIMARY KEY);'
+            'CREATE TABLE IF NOT EXISTS frontier('
+            'seq INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL UNIQUE, claimed INTEGER NOT NULL DEFAULT 0);'
+            'UPDATE frontier SET claimed = 0;'
+            'CREATE TABLE IF NOT EXISTS pages('
+            'seq INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL, title TEXT NOT NULL, content TEXT NOT NULL, '
+            'internal_links BLOB NOT NULL, dom_properties BLOB NOT NULL);'
+        )
+        self.db.commit()
+        self._pending_writes = 0
+
+        self._recent: OrderedDict = OrderedDict()
+
+    def enqueue(self, url: str) -> bool:
+        """Queue a URL unless it is already queued or visited. Returns True if it was added."""
+        if url in self._recent:
+            self._recent.move_to_end(url)
+            return False
+        
+        cursor = self.db.execute(
+            'INSERT OR IGNORE INTO frontier(url) SELECT ? WHERE NOT EXISTS (SELECT 1 FROM visited WHERE url = ?)',
+            (url, url)
+        )
+        self._wrote()
+        self._remember(url)
+        return cursor.rowcount == 1
+
+    def _remember(self, url: str) -> None:
+        self._recent[url] = None
+        if len(self._recent) > self.RECENT_CAPACITY:
+            self._recent.popitem(last=False)
+
+    def claim(self) -> Optional[str]:
+        """Claim and return the oldest unclaimed queued URL, or None if there is none."""
+        row = self.db.execute('SELECT seq, url FROM frontier WHERE claimed = 0 ORDER BY seq LIMIT 1').fetchone()
+        if row is None:
+            return None
+        self.db.execute('UPDATE frontier SET claimed = 1 WHERE seq = ?', (row[0],))
+        self._wrote()
+        return row[1]
+
+    def finish(self, url: str, page: Optional[Dict] = None) -> None:
+        """Move a claimed URL to the visited set, saving its scraped page if there is one.
+
+        Call only after the page's outlinks are queued.
+        """
+        if page:
+            self.db.execute(
+                'INSERT INTO pages(url, title, content, internal_links, dom_properties) VALUES (?, ?, ?, ?, ?)',
+                (page['url'], page['title'], page['content'],
+                 orjson.dumps(page['internal_links']), orjson.dumps(page['dom_properties']))
+            )
+        self.db.execute('INSERT OR IGNORE INTO visited(url) VALUES (?)', (url,))
+        self.db.execute('DELETE FROM frontier WHERE url = ?', (url,))
+        self._wrote()
+
+    def pages(self) -> Iterator[Tuple[str, str, str, List[str], Dict]]:
+        """Yield every saved page as (url, title, content, internal_links, dom_properties), in scrape order."""
+        rows = self.db.execute('SELECT url, title, content, internal_links, dom_properties FROM pages ORDER BY seq')
+        for url, title, content, links, dom in rows:
+            yield url, title, content, orjson.loads(links), orjson.loads(dom)
+
+    def visited_count(self) -> int:
+        return self.db.execute('SELECT COUNT(*) FROM visited').fetchone()[0]
+
+    def commit(self) -> None:
+        self.db.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        self.commit()
+        self.db.close()
+
+    def _wrote(self) -> None:
+        self._pending_writes += 1
+        if self._pending_writes >= self.COMMIT_EVERY:
+            self.commit()
+
 
 class WebScraper:
-    def __init__(self, start_url: str, delay: float = 1.0, timeout: int = 30):
+    def __init__(self, start_url: str, delay: float = 1.0, timeout: int = 30, concurrency: int = 4,
+                 state_db: Optional[str] = None, dom_file: str = 'scraped_dom.ndjson'):
         """
         Initialize the web scraper with Playwright.
         
         Args:
             start_url: The starting URL to scrape
-            delay: Delay between requests (seconds)
+            delay: Delay between requests, per worker (seconds)
             timeout: Request timeout (seconds)
+            concurrency: Number of pages fetched in parallel
+            state_db: SQLite file holding the visited set and frontier; reuse it to resume a crawl.
+                Defaults to a temporary file that is deleted once the crawl finishes cleanly.
+            dom_file: NDJSON file receiving each page's full DOM properties
         """
         self.start_url = start_url
         self.delay = delay
         self.timeout = timeout * 1000  # Playwright uses milliseconds
+        self.concurrency = max(1, concurrency)
+        self.dom_file = dom_file
         
         parsed = urlparse(start_url)
         self.domain = f"{parsed.scheme}://{parsed.netloc}"
+        self._start_netloc = parsed.netloc
         
-        self.visited: Set[str] = set()
-        self.to_visit: List[str] = [start_url]
-        self.data: List[Dict] = []
+        self.state_db = state_db
+        # Opened for the duration of crawl()
+        self.state: Optional[CrawlState] = None
+        # Scraped pages, stored column-wise: index i of each list is one page
+        self.urls: List[str] = []
+        self.titles: List[str] = []
+        self.contents: List[str] = []
+        self.links: List[List[str]] = []
+        self.doms: List[Dict] = []
         self.errors: List[Dict] = []
         
+        # Worker coordination, set up per crawl
+        self._in_flight = 0
+        self._frontier_changed: Optional[asyncio.Event] = None
+        # Set once a page's DOM fails to settle; later pages wait for network idle
+        self._wait_for_network_idle = False
+        
         self.playwright = None
         self.browser = None
         self.context = None
+        self._dom_fh = None
         
         logger.info(f"Initialized scraper for domain: {self.domain}")
 
-    def start_browser(self):
+    async def start_browser(self):
         """Start the Playwright browser."""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=True)
-        self.context = self.browser.new_context(
+        # A resumed crawl never rescrapes visited pages, so keep their DOM records
+        self._dom_fh = open(self.dom_file, 'ab' if self.state.visited_count() else 'wb')
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        self.context = await self.browser.new_context(
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             viewport={'width': 1920, 'height': 1080}
         )
+        await self.context.route('**/*', self._block_heavy_resources)
+
+    async def _block_heavy_resources(self, route):
+        """Abort requests for resource types that do not affect the scraped HTML."""
+        if should_abort_request(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
 
-    def stop_browser(self):
+    async def stop_browser(self):
         """Stop the Playwright browser."""
         if self.context:
-            self.context.close()
+            await self.context.close()
         if self.browser:
-            self.browser.close()
+            await self.browser.close()
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
+        if self._dom_fh:
+            self._dom_fh.close()
 
     def is_internal_link(self, url: str) -> bool:
         """Check if URL belongs to the same domain."""
         try:
-            parsed = urlparse(url)
-            return parsed.netloc == urlparse(self.start_url).netloc
+            return urlparse(url).netloc == self._start_netloc
         except:
             return False
 
-    def normalize_url(self, url: str) -> str:
-        """Normalize and resolve relative URLs."""
+    def normalize_url(self, url: str, base: Optional[str] = None) -> str:
+        """Normalize and resolve relative URLs against `base` (default: the start URL)."""
         try:
-            resolved = urljoin(self.start_url, url)
-            parsed = urlparse(resolved)
             # Remove fragments
-            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}{'?' + parsed.query if parsed.query else ''}"
+            resolved, _ = urldefrag(urljoin(base or self.start_url, url))
+            return resolved
         except:
             return url
 
@@ -89,88 +247,128 @@ class WebScraper:
         """Extract detailed DOM element properties."""
         dom_props = []
         try:
-            # Helper to generate a simple CSS selector path
-            def get_path(element):
-                path = []
-                for parent in element.parents:
-                    if parent.name == '[document]':
+            # Collect only as much of the subtree's text as the 200-char preview
+            # needs, instead of get_text() re-walking every descendant
+            def text_preview(element):
+                parts = []
+                length = 0
+                for string in element.stripped_strings:
+                    parts.append(string)
+                    length += len(string)
+                    if length >= 200:
                         break
-                    siblings = parent.find_all(element.name, recursive=False)
-                    if len(siblings) > 1:
-                        index = siblings.index(element) + 1
-                        path.append(f"{element.name}:nth-of-type({index})")
-                    else:
-                        path.append(element.name)
-                    element = parent
-                return " > ".join(reversed(path))
+                return ''.join(parts)[:200]
 
-            for elem in soup.find_all(True):
-                if elem.name and elem.name not in ['script', 'style']:
-                    text = elem.get_text(strip=True)[:200]
-                    
-                    # Convert attrs to a serializable dict
-                    attrs = {}
-                    for k, v in elem.attrs.items():
-                        if isinstance(v, list):
-                            attrs[k] = " ".join(v)
+            # Walk the tree top-down once, building each CSS selector path from
+            # its parent's path instead of re-walking the ancestors per element
+            def child_paths(parent, parent_path):
+                children = [child for child in parent.children if isinstance(child, Tag)]
+                totals = Counter(child.name for child in children)
+                seen = defaultdict(int)
+                entries = []
+                for elem in children:
+                    seen[elem.name] += 1
+                    if elem.name in ('script', 'style'):
+                        continue
+
+                    # Top-level elements get an empty path, matching the document root
+                    if parent_path is None:
+                        path = ''
+                    else:
+                        if totals[elem.name] > 1:
+                            segment = f"{elem.name}:nth-of-type({seen[elem.name]})"
                         else:
-                            attrs[k] = str(v)
-
-                    dom_props.append({
-                        'tag': elem.name,
-                        'path': get_path(elem),
-                        'attributes': attrs,
-                        'text_preview': text if text else None
-                    })
+                            segment = elem.name
+                        path = f"{parent_path} > {segment}" if parent_path else segment
+                    entries.append((elem, path))
+                return entries
+
+            # Explicit stack rather than recursion, so deeply nested pages cannot
+            # hit the recursion limit; children are pushed reversed to keep
+            # document order
+            stack = child_paths(soup, None)[::-1]
+            while stack:
+                elem, path = stack.pop()
+                text = text_preview(elem)
+                
+                # Convert attrs to a serializable dict
+                attrs = {
+                    k: " ".join(v) if isinstance(v, list) else str(v)
+                    for k, v in elem.attrs.items()
+                }
+
+                dom_props.append({
+                    'tag': elem.name,
+                    'path': path,
+                    'attributes': attrs,
+                    'text_preview': text if text else None
+                })
+                stack.extend(reversed(child_paths(elem, path)))
         except Exception as e:
             logger.warning(f"Error extracting DOM properties: {e}")
         
         return dom_props
 
-    def scrape_page(self, page, url: str) -> Optional[Dict]:
+    async def scrape_page(self, page, url: str) -> Optional[Dict]:
         """
         Scrape a single page using Playwright and extract data.
         """
         try:
             logger.info(f"Navigating to: {url}")
-            page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+            await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
             
-            # Wait for some dynamic content if needed, key heuristic: check if body is not empty or network idle
-            try:
-                page.wait_for_load_state('networkidle', timeout=5000)
-            except PlaywrightTimeoutError:
-                logger.warning(f"Timeout waiting for network idle on {url}, proceeding with current content")
+            # Proceed as soon as the rendered text stops changing; if a page never
+            # settles, treat the site as dynamic and wait for network idle instead
+            if not self._wait_for_network_idle:
+                try:
+                    await page.wait_for_function(DOM_STABLE_JS, timeout=3000, polling=200)
+                except PlaywrightTimeoutError:
+                    logger.info(f"DOM did not settle on {url}, waiting for network idle from now on")
+                    self._wait_for_network_idle = True
             
-            # Additional small wait for JS rendering
-            time.sleep(1)
+            if self._wait_for_network_idle:
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"Timeout waiting for network idle on {url}, proceeding with current content")
             
-            content_html = page.content()
-            soup = BeautifulSoup(content_html, 'html.parser')
+            content_html = await page.content()
+            soup = BeautifulSoup(content_html, 'lxml')
             
             # Extract title
-            title = soup.title.string if soup.title else page.title()
+            title = soup.title.string if soup.title else await page.title()
             
             # Extract all text content
             content = soup.get_text(separator='\n', strip=True)
             
-            # Extract internal links
+            # Extract internal links, resolved against the page itself (and its
+            # <base href>, if any) rather than the start URL
+            base_url = page.url
+            base = soup.head.find('base', href=True) if soup.head else None
+            if base:
+                try:
+                    base_url = urljoin(base_url, base['href'])
+                except ValueError:
+                    pass
             internal_links = set()
             for a in soup.find_all('a', href=True):
                 href = a['href']
-                if href and not href.startswith(('mailto:', 'tel:', 'javascript:')):
-                    normalized = self.normalize_url(href)
+                if href and not has_skipped_scheme(href):
+                    normalized = self.normalize_url(href, base_url)
                     if self.is_internal_link(normalized):
                         internal_links.add(normalized)
             
-            # Extract DOM properties
+            # Extract DOM properties and stream them to the sidecar file, keeping
+            # only a summary in memory
             dom_properties = self.extract_dom_properties(soup)
+            self._dom_fh.write(orjson.dumps({'url': url, 'dom': dom_properties}) + b'\n')
             
             data = {
                 'url': url,
                 'title': title,
                 'content': content,
                 'internal_links': sorted(list(internal_links)),
-                'dom_properties': dom_properties
+                'dom_properties': {'count': len(dom_properties), 'sidecar': self.dom_file}
             }
             
             logger.info(f"Successfully scraped {url} ({len(content)} chars, {len(internal_links)} links)")
@@ -186,45 +384,118 @@ class WebScraper:
         """
         Recursively crawl the website using Playwright.
         """
-        logger.info(f"Starting crawl from {self.start_url}")
-        self.start_browser()
+        # The temporary default only outlives the crawl if it is interrupted
+        state_db = self.state_db
+        if state_db is None:
+            fd, state_db = tempfile.mkstemp(prefix='crawl-state-', suffix='.db')
+            os.close(fd)
         
+        finished = False
         try:
-            # Create a reusable page
-            page = self.context.new_page()
-            
-            while self.to_visit and (max_pages is None or len(self.data) < max_pages):
-                url = self.to_visit.pop(0)
-                
-                if url in self.visited:
+            self.state = CrawlState(state_db)
+            self.state.enqueue(self.start_url)
+            self.state.commit()
+            self._load_saved_pages()
+            finished = asyncio.run(self._crawl(max_pages))
+        finally:
+            if self.state:
+                self.state.close()
+                self.state = None
+            if self.state_db is None:
+                if finished:
+                    os.remove(state_db)
+                else:
+                    logger.warning(f"Crawl state kept at {state_db}; pass it as --state-db to resume")
+
+    def _load_saved_pages(self) -> None:
+        """Fill the page columns from the crawl state, so a resumed crawl exports earlier pages too."""
+        self.urls, self.titles, self.contents, self.links, self.doms = [], [], [], [], []
+        for url, title, content, links, dom in self.state.pages():
+            self.urls.append(url)
+            self.titles.append(title)
+            self.contents.append(content)
+            self.links.append(links)
+            self.doms.append(dom)
+
+    async def _crawl(self, max_pages: Optional[int]) -> bool:
+        """Run `concurrency` workers, each driving its own page, until the frontier drains."""
+        logger.info(f"Starting crawl from {self.start_url} with {self.concurrency} workers")
+        visited = self.state.visited_count()
+        if visited:
+            logger.info(f"Resuming crawl, {visited} URLs already visited")
+        self._in_flight = 0
+        self._frontier_changed = asyncio.Event()
+        
+        workers = []
+        try:
+            await self.start_browser()
+            workers = [asyncio.create_task(self._worker(max_pages)) for _ in range(self.concurrency)]
+            await asyncio.gather(*workers)
+            return True
+        except Exception as e:
+            logger.error(f"Crawl aborted due to error: {e}")
+            return False
+        finally:
+            # Stop any workers still running so none writes to the state after the final commit
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.state.commit()
+            await self.stop_browser()
+            logger.info(f"Crawl complete. Scraped {len(self.urls)} pages, {len(self.errors)} errors")
+
+    async def _worker(self, max_pages: Optional[int]) -> None:
+        """Pull URLs off the shared frontier and scrape them with one reusable page."""
+        page = await self.context.new_page()
+        
+        try:
+            while max_pages is None or len(self.urls) < max_pages:
+                # Wait while the frontier is empty or the remaining page budget is
+                # already claimed by other workers; stop once nothing is in flight
+                budget_claimed = max_pages is not None and len(self.urls) + self._in_flight >= max_pages
+                url = None if budget_claimed else self.state.claim()
+                if url is None:
+                    if not self._in_flight:
+                        break
+                    self._frontier_changed.clear()
+                    await self._frontier_changed.wait()
                     continue
                 
-                self.visited.add(url)
-                page_data = self.scrape_page(page, url)
-                
-                if page_data:
-                    self.data.append(page_data)
-                    # Add new internal links to the queue
-                    for link in page_data['internal_links']:
-                        if link not in self.visited and link not in self.to_visit:
-                            self.to_visit.append(link)
-                
-                time.sleep(self.delay)
+                self._in_flight += 1
+                try:
+                    page_data = await self.scrape_page(page, url)
+                    
+                    if page_data:
+                        self.urls.append(page_data['url'])
+                        self.titles.append(page_data['title'])
+                        self.contents.append(page_data['content'])
+                        self.links.append(page_data['internal_links'])
+                        self.doms.append(page_data['dom_properties'])
+                        # Add new internal links to the queue
+                        for link in page_data['internal_links']:
+                            self.state.enqueue(link)
+                    self.state.finish(url, page_data)
+                finally:
+                    self._in_flight -= 1
+                    self._frontier_changed.set()
                 
-        except Exception as e:
-            logger.error(f"Crawl aborted due to error: {e}")
+                await asyncio.sleep(self.delay)
         finally:
-            self.stop_browser()
-            logger.info(f"Crawl complete. Scraped {len(self.data)} pages, {len(self.errors)} errors")
+            await page.close()
 
     def save_to_xlsx(self, filename: str = 'scraped_content.xlsx') -> None:
         """Save text content to XLSX file."""
         try:
-            import pandas as pd
+            import xlsxwriter
             
-            xlsx_data = [{'URL': item['url'], 'Content': item['content']} for item in self.data]
-            df = pd.DataFrame(xlsx_data)
-            df.to_excel(filename, index=False)
+            # constant_memory flushes each row as soon as the next one starts
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, ['URL', 'Content'])
+            for row, (url, content) in enumerate(zip(self.urls, self.contents), 1):
+                worksheet.write_string(row, 0, url)
+                worksheet.write_string(row, 1, content)
+            workbook.close()
             logger.info(f"Saved XLSX to {filename}")
         except Exception as e:
             logger.error(f"Failed to save XLSX: {e}. Please close the file if it is open.")
@@ -232,18 +503,23 @@ class WebScraper:
     def save_to_json(self, filename: str = 'scraped_data.json') -> None:
         """Save structured data (excluding content) to JSON file."""
         try:
-            json_data = [
+            records = (
                 {
-                    'url': item['url'],
-                    'title': item['title'],
-                    'internal_links': item['internal_links'],
-                    'dom_properties': item['dom_properties']
+                    'url': url,
+                    'title': title,
+                    'internal_links': links,
+                    'dom_properties': dom
                 }
-                for item in self.data
-            ]
+                for url, title, links, dom in zip(self.urls, self.titles, self.links, self.doms)
+            )
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            # Encode one record at a time rather than the whole list at once
+            with open(filename, 'wb') as f:
+                f.write(b'[')
+                for i, record in enumerate(records):
+                    f.write(b',\n' if i else b'\n')
+                    f.write(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+                f.write(b'\n]\n')
             logger.info(f"Saved JSON to {filename}")
         except Exception as e:
             logger.error(f"Failed to save JSON: {e}")
@@ -252,8 +528,8 @@ class WebScraper:
         """Save error log to JSON file."""
         try:
             if self.errors:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.errors, f, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(self.errors, option=orjson.OPT_INDENT_2))
                 logger.info(f"Saved errors to {filename}")
         except Exception as e:
             logger.error(f"Failed to save errors: {e}")
@@ -268,13 +544,21 @@ def main():
     parser.add_argument('url', help='Starting URL to scrape')
     parser.add_argument('--xlsx', default='scraped_content.xlsx', help='XLSX output file')
     parser.add_argument('--json', default='scraped_data.json', help='JSON output file')
+    parser.add_argument('--dom', default='scraped_dom.ndjson', help='NDJSON output file for full DOM properties')
     parser.add_argument('--max-pages', type=int, help='Maximum pages to scrape')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests (seconds)')
     parser.add_argument('--timeout', type=int, default=30, help='Request timeout (seconds)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Pages fetched in parallel')
+    parser.add_argument(
+        '--state-db', help='SQLite file for crawl state; reuse it to resume a crawl (default: temporary file)'
+    )
     
     args = parser.parse_args()
     
-    scraper = WebScraper(args.url, delay=args.delay, timeout=args.timeout)
+    scraper = WebScraper(
+        args.url, delay=args.delay, timeout=args.timeout, concurrency=args.concurrency, state_db=args.state_db,
+        dom_file=args.dom
+    )
     scraper.crawl(max_pages=args.max_pages)
     
     scraper.save_to_xlsx(args.xlsx)
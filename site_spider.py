@@ -1,12 +1,26 @@
+import logging
 import os
+import queue
 import re
+import threading
 from urllib.parse import urlparse, urldefrag
 import scrapy
+from lxml import etree
+
+from items import PageItem
+from resource_filter import should_abort_request
 
 
 EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
 PHONE_RE = re.compile(r"\+?\d[\d\-().\s]{6,}\d")
 
+# Compiled once and evaluated directly on the response's lxml tree, skipping
+# the per-call CSS-to-XPath translation and selector lookup
+TITLE_XPATH = etree.XPath('//title/text()', smart_strings=False)
+META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]/@content', smart_strings=False)
+BODY_TEXT_XPATH = etree.XPath('//body//text()[normalize-space()]', smart_strings=False)
+LINK_HREF_XPATH = etree.XPath('//a/@href', smart_strings=False)
+
 
 class SiteSpider(scrapy.Spider):
     name = 'site_spider'
@@ -16,6 +30,7 @@ class SiteSpider(scrapy.Spider):
             'https': 'scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler',
         },
         'TWISTED_REACTOR': 'twisted.internet.asyncioreactor.AsyncioSelectorReactor',
+        'PLAYWRIGHT_ABORT_REQUEST': should_abort_request,
     }
 
     def __init__(self, start_url, output_dir='output', *args, **kwargs):
@@ -25,6 +40,32 @@ class SiteSpider(scrapy.Spider):
         parsed = urlparse(start_url)
         self.allowed_domains = [parsed.netloc]
 
+        # Saved pages are written by a background thread so parse() never
+        # blocks the reactor on disk I/O; the bounded queue applies backpressure
+        self._io_q = queue.Queue(maxsize=64)
+        self._io_thread = threading.Thread(target=self._writer, name='site-spider-writer', daemon=True)
+        self._io_thread.start()
+
+    def _writer(self):
+        while True:
+            job = self._io_q.get()
+            if job is None:
+                break
+            url, dirpath, file_path, body = job
+            try:
+                os.makedirs(dirpath, exist_ok=True)
+                with open(file_path, 'wb') as f:
+                    f.write(body)
+                self.log(f'Saved {url} -> {file_path}')
+            except Exception as e:
+                # Never let the thread die while parse() may still be queueing jobs
+                self.log(f'Failed to save {url} -> {file_path}: {e}', level=logging.ERROR)
+
+    def closed(self, reason):
+        # Let queued writes finish before the process exits
+        self._io_q.put(None)
+        self._io_thread.join()
+
     def start_requests(self):
         for url in self.start_urls:
             yield scrapy.Request(
@@ -50,24 +91,21 @@ class SiteSpider(scrapy.Spider):
             filename = os.path.basename(path.lstrip('/')) or 'index.html'
 
         dirpath = os.path.join(self.output_dir, parsed.netloc, dir_rel)
-        os.makedirs(dirpath, exist_ok=True)
         file_path = os.path.join(dirpath, filename)
-
-        with open(file_path, 'wb') as f:
-            f.write(response.body)
-
-        self.log(f'Saved {response.url} -> {file_path}')
-
-        # Extract structured data
-        title = (response.css('title::text').get() or '').strip()
-        meta_desc = (response.css('meta[name=description]::attr(content)').get() or '').strip()
-        body_texts = response.xpath('//body//text()[normalize-space()]').getall()
+        self._io_q.put((response.url, dirpath, file_path, response.body))
+
+        # Extract structured data from the lxml tree Scrapy has already parsed
+        root = response.selector.root
+        titles = TITLE_XPATH(root)
+        title = (titles[0] if titles else '').strip()
+        meta_descs = META_DESCRIPTION_XPATH(root)
+        meta_desc = (meta_descs[0] if meta_descs else '').strip()
+        body_texts = BODY_TEXT_XPATH(root)
         page_text = ' '.join(t.strip() for t in body_texts if t and t.strip())
 
         internal_links = []
         external_links = []
-        raw_links = response.css('a::attr(href)').getall()
-        for href in raw_links:
+        for href in LINK_HREF_XPATH(root):
             if not href:
                 continue
             if href.startswith('mailto:') or href.startswith('tel:') or href.startswith('javascript:'):
@@ -80,22 +118,22 @@ class SiteSpider(scrapy.Spider):
             else:
                 internal_links.append(href)
 
-        # Extract contacts
-        emails = set(EMAIL_RE.findall(response.text))
-        phones = set(PHONE_RE.findall(response.text))
-
-        item = {
-            'url': response.url,
-            'title': title,
-            'meta_description': meta_desc,
-            'text': page_text,
-            'html': response.text,
-            'internal_links': '; '.join(sorted(set(internal_links))),
-            'external_links': '; '.join(sorted(set(external_links))),
-            'emails': '; '.join(sorted(emails)),
-            'phones': '; '.join(sorted(phones)),
-            'saved_path': file_path,
-        }
+        # Extract contacts, decoding the body only once
+        text = response.text
+        emails = set(EMAIL_RE.findall(text))
+        phones = set(PHONE_RE.findall(text))
+
+        item = PageItem(
+            url=response.url,
+            title=title,
+            meta_description=meta_desc,
+            text=page_text,
+            internal_links='; '.join(sorted(set(internal_links))),
+            external_links='; '.join(sorted(set(external_links))),
+            emails='; '.join(sorted(emails)),
+            phones='; '.join(sorted(phones)),
+            saved_path=file_path,
+        )
 
         yield item
 